@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -19,64 +19,65 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database. Participants are kept as insertion-ordered
+# dict keys (values unused) so membership checks and removals are O(1)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     # Sports related activities
     "Soccer Team": {
         "description": "Join the school soccer team and compete in matches",
         "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu", "lucas@mergington.edu"])
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly games",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["mia@mergington.edu", "noah@mergington.edu"]
+        "participants": dict.fromkeys(["mia@mergington.edu", "noah@mergington.edu"])
     },
     # Artistic activities
     "Art Workshop": {
         "description": "Explore painting, drawing, and sculpture techniques",
         "schedule": "Mondays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["ava@mergington.edu", "liam@mergington.edu"]
+        "participants": dict.fromkeys(["ava@mergington.edu", "liam@mergington.edu"])
     },
     "Drama Club": {
         "description": "Act in plays and learn stage performance skills",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["ella@mergington.edu", "jack@mergington.edu"]
+        "participants": dict.fromkeys(["ella@mergington.edu", "jack@mergington.edu"])
     },
     # Intellectual activities
     "Math Olympiad": {
         "description": "Prepare for math competitions and solve challenging problems",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 10,
-        "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
+        "participants": dict.fromkeys(["ethan@mergington.edu", "isabella@mergington.edu"])
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["benjamin@mergington.edu", "charlotte@mergington.edu"]
+        "participants": dict.fromkeys(["benjamin@mergington.edu", "charlotte@mergington.edu"])
     }
 }
 
@@ -87,8 +88,12 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities() -> dict[str, dict]:
+    # The return type lets FastAPI serialize straight to JSON bytes via Pydantic
+    return {
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -104,10 +109,34 @@ def signup_for_activity(activity_name: str, email: str):
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/{activity_name}/bulk_signup")
+def bulk_signup_for_activity(activity_name: str, emails: list[str] = Body(...)):
+    """Sign up several students for an activity in a single request"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    # Validate the request lists at least one email, each only once
+    if not emails:
+        raise HTTPException(status_code=422, detail="No emails provided")
+    if len(set(emails)) != len(emails):
+        raise HTTPException(status_code=400, detail="Duplicate email in request")
+
+    # Get the specific activity
+    activity = activities[activity_name]
+    # Validate no student is already signed up
+    if any(email in activity["participants"] for email in emails):
+        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+    # Add students
+    activity["participants"].update(dict.fromkeys(emails))
+    noun = "student" if len(emails) == 1 else "students"
+    return {"message": f"Signed up {len(emails)} {noun} for {activity_name}"}
+
+
 @app.delete("/activities/{activity_name}/participants/{email}")
 def remove_participant(activity_name: str, email: str):
     """Remove a participant from an activity"""
@@ -123,5 +152,30 @@ def remove_participant(activity_name: str, email: str):
         raise HTTPException(status_code=404, detail="Participant is not signed up for this activity")
     
     # Remove participant
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Removed {email} from {activity_name}"}
+
+
+@app.delete("/activities/{activity_name}/participants")
+def bulk_remove_participants(activity_name: str, emails: list[str] = Query(...)):
+    """Remove several participants from an activity in a single request"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    # Validate each email is listed only once
+    if len(set(emails)) != len(emails):
+        raise HTTPException(status_code=400, detail="Duplicate email in request")
+
+    # Get the specific activity
+    activity = activities[activity_name]
+
+    # Validate every participant is signed up
+    if any(email not in activity["participants"] for email in emails):
+        raise HTTPException(status_code=404, detail="Participant is not signed up for this activity")
+
+    # Remove participants
+    for email in emails:
+        del activity["participants"][email]
+    noun = "participant" if len(emails) == 1 else "participants"
+    return {"message": f"Removed {len(emails)} {noun} from {activity_name}"}
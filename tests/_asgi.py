@@ -0,0 +1,56 @@
+"""
+Minimal in-process ASGI caller for request-heavy tests.
+
+Builds the HTTP scope directly and drives the app, skipping the httpx
+request/response machinery that TestClient and AsyncClient add per call.
+"""
+
+import json as jsonlib
+from urllib.parse import quote, urlencode
+
+
+async def asgi_call(app, method, path, query=None, json=None):
+    """Call the ASGI app once and return (status_code, body_bytes)."""
+    headers = [(b"host", b"test")]
+    body = b""
+    if json is not None:
+        body = jsonlib.dumps(json).encode()
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": quote(path).encode(),
+        "query_string": urlencode(query or {}, doseq=True).encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("testclient", 50000),
+        "server": ("test", 80),
+    }
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = None
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
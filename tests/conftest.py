@@ -2,93 +2,119 @@
 Test configuration and fixtures for the Mergington High School Activities API.
 """
 
+import asyncio
+import time
+from collections import defaultdict
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-import sys
-import os
-
-# Add src directory to path so we can import the app
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from app import app, activities
 
+from ._asgi import asgi_call
+from ._baseline import BASELINE_ACTIVITIES
 
-@pytest.fixture
+
+class FixtureTimer:
+    """Accumulate setup time per fixture name and report the slowest ones."""
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # Parametrize arguments are set up as pseudo-fixtures; leave them out
+        callspec = getattr(request.node, "callspec", None)
+        if callspec is not None and fixturedef.argname in callspec.params:
+            yield
+            return
+        start = time.perf_counter()
+        yield
+        self.durations[fixturedef.argname] += time.perf_counter() - start
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.durations:
+            return
+        terminalreporter.section("fixture setup durations")
+        slowest = sorted(self.durations.items(), key=lambda item: item[1], reverse=True)
+        for name, total in slowest[:10]:
+            terminalreporter.write_line(f"{total:.4f}s {name}")
+
+
+def pytest_configure(config):
+    # Registered as a plugin so session-scoped fixtures are timed too;
+    # hooks defined directly in conftest only see fixtures of its own tests.
+    config.pluginmanager.register(FixtureTimer(), "fixture-timer")
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session."""
+    with TestClient(app) as c:
+        yield c
+
+
+async def _warmup_async_paths():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get("/activities")
+        assert response.status_code == 200
+    status, _ = await asgi_call(app, "GET", "/activities")
+    assert status == 200
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """Exercise each request path once so one-time costs stay out of timed tests."""
+    # Timed tests go through TestClient, httpx.AsyncClient and asgi_call
+    email = "warmup@mergington.edu"
+    assert client.get("/activities").status_code == 200
+    response = client.post("/activities/Chess Club/signup", params={"email": email})
+    assert response.status_code == 200
+    response = client.delete(f"/activities/Chess Club/participants/{email}")
+    assert response.status_code == 200
+    asyncio.run(_warmup_async_paths())
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_client():
+    """Create an async client that calls the app in-process without a thread hop."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def state():
+    """The app's in-memory activities data, for asserting on it directly."""
+    return activities
+
+
+def _restore_baseline():
+    # Participants are the only mutable field, so a shallow copy of each
+    # activity with fresh participants is enough to isolate tests
+    activities.clear()
+    for name, data in BASELINE_ACTIVITIES.items():
+        activities[name] = {**data, "participants": dict.fromkeys(data["participants"])}
 
 
 @pytest.fixture
 def reset_activities():
     """Reset activities to initial state before each test."""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["mia@mergington.edu", "noah@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ava@mergington.edu", "liam@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in plays and learn stage performance skills",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ella@mergington.edu", "jack@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for math competitions and solve challenging problems",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 10,
-            "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["benjamin@mergington.edu", "charlotte@mergington.edu"]
-        }
-    }
-    
-    # Reset activities to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Clean up after test (reset again)
-    activities.clear()
-    activities.update(original_activities)
+    _restore_baseline()
+
+
+@pytest.fixture(scope="class")
+def reset_activities_once():
+    """Reset activities once for a test class whose tests don't interfere."""
+    _restore_baseline()
 
 
 @pytest.fixture
@@ -6,6 +6,13 @@ import pytest
 from fastapi.testclient import TestClient
 
 
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club", "Programming Class", "Gym Class",
+    "Soccer Team", "Basketball Club", "Art Workshop",
+    "Drama Club", "Math Olympiad", "Science Club"
+})
+
+
 class TestRootEndpoint:
     """Test cases for the root endpoint."""
     
@@ -19,7 +26,7 @@ class TestRootEndpoint:
 class TestActivitiesEndpoint:
     """Test cases for the activities endpoints."""
     
-    def test_get_activities_success(self, client: TestClient, reset_activities):
+    def test_get_activities_success(self, client: TestClient):
         """Test successful retrieval of all activities."""
         response = client.get("/activities")
         assert response.status_code == 200
@@ -38,23 +45,11 @@ class TestActivitiesEndpoint:
             assert isinstance(activity_data["max_participants"], int)
     
     def test_get_activities_contains_expected_activities(self, client: TestClient, reset_activities):
-        """Test that the response contains expected activities."""
+        """Test that the response contains expected activities and their data."""
         response = client.get("/activities")
         data = response.json()
         
-        expected_activities = [
-            "Chess Club", "Programming Class", "Gym Class", 
-            "Soccer Team", "Basketball Club", "Art Workshop",
-            "Drama Club", "Math Olympiad", "Science Club"
-        ]
-        
-        for activity in expected_activities:
-            assert activity in data
-    
-    def test_activities_data_structure(self, client: TestClient, reset_activities):
-        """Test the structure of activity data."""
-        response = client.get("/activities")
-        data = response.json()
+        assert EXPECTED_ACTIVITIES.issubset(data.keys())
         
         # Test Chess Club specifically
         chess_club = data["Chess Club"]
@@ -68,10 +63,10 @@ class TestActivitiesEndpoint:
 class TestSignupEndpoint:
     """Test cases for the signup endpoint."""
     
-    def test_signup_success(self, client: TestClient, reset_activities):
+    def test_signup_success(self, client: TestClient, reset_activities, state):
         """Test successful signup for an activity."""
         response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+            "/activities/Chess Club/signup", params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
@@ -81,31 +76,24 @@ class TestSignupEndpoint:
         assert "Chess Club" in data["message"]
         
         # Verify the participant was actually added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in state["Chess Club"]["participants"]
     
-    def test_signup_activity_not_found(self, client: TestClient, reset_activities):
-        """Test signup for non-existent activity."""
-        response = client.post(
-            "/activities/Non-existent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_signup_duplicate_student(self, client: TestClient, reset_activities):
-        """Test signup when student is already registered."""
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
+    @pytest.mark.parametrize("activity, email, expected_status, expected_detail", [
+        # Non-existent activity
+        ("Non-existent Activity", "test@mergington.edu", 404, "Activity not found"),
+        # Student is already registered
+        ("Chess Club", "michael@mergington.edu", 400, "Student already signed up for this activity"),
+    ])
+    def test_signup_errors(self, client: TestClient, reset_activities,
+                           activity, email, expected_status, expected_detail):
+        """Test signup error responses."""
+        response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        assert response.status_code == expected_status
         
         data = response.json()
-        assert data["detail"] == "Student already signed up for this activity"
+        assert data["detail"] == expected_detail
     
-    def test_signup_url_encoding(self, client: TestClient, reset_activities):
+    def test_signup_url_encoding(self, client: TestClient, reset_activities, state):
         """Test signup with URL-encoded activity name and email."""
         response = client.post(
             "/activities/Programming%20Class/signup?email=test%40mergington.edu"
@@ -113,31 +101,67 @@ class TestSignupEndpoint:
         assert response.status_code == 200
         
         # Verify the participant was actually added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Programming Class"]["participants"]
+        assert "test@mergington.edu" in state["Programming Class"]["participants"]
     
-    def test_signup_missing_email(self, client: TestClient, reset_activities):
+    def test_signup_missing_email(self, client: TestClient):
         """Test signup without email parameter."""
         response = client.post("/activities/Chess Club/signup")
         assert response.status_code == 422  # Validation error
     
     def test_signup_empty_email(self, client: TestClient, reset_activities):
         """Test signup with empty email."""
-        response = client.post("/activities/Chess Club/signup?email=")
+        response = client.post("/activities/Chess Club/signup", params={"email": ""})
         # FastAPI currently accepts empty emails, but in a real app you'd want validation
         assert response.status_code in [200, 422]  # Either succeeds or validation error
 
 
+class TestBulkSignupEndpoint:
+    """Test cases for the bulk signup endpoint."""
+    
+    def test_bulk_signup_success(self, client: TestClient, reset_activities, state):
+        """Test signing up several students in one request."""
+        emails = ["bulk.one@mergington.edu", "bulk.two@mergington.edu"]
+        response = client.post("/activities/Chess Club/bulk_signup", json=emails)
+        assert response.status_code == 200
+        assert response.json()["message"] == "Signed up 2 students for Chess Club"
+        
+        # Verify the participants were actually added
+        assert list(state["Chess Club"]["participants"])[-2:] == emails
+    
+    def test_bulk_signup_single_student_message(self, client: TestClient, reset_activities):
+        """Test the bulk signup message for a single student."""
+        response = client.post("/activities/Chess Club/bulk_signup", json=["bulk.one@mergington.edu"])
+        assert response.status_code == 200
+        assert response.json()["message"] == "Signed up 1 student for Chess Club"
+    
+    @pytest.mark.parametrize("activity, emails, expected_status, expected_detail", [
+        # Non-existent activity
+        ("Non-existent Activity", ["test@mergington.edu"], 404, "Activity not found"),
+        # One student is already registered
+        ("Chess Club", ["new@mergington.edu", "michael@mergington.edu"], 400,
+         "Student already signed up for this activity"),
+        # Same student listed twice
+        ("Chess Club", ["new@mergington.edu", "new@mergington.edu"], 400,
+         "Duplicate email in request"),
+        # No students listed
+        ("Chess Club", [], 422, "No emails provided"),
+    ])
+    def test_bulk_signup_errors(self, client: TestClient, reset_activities, state,
+                                activity, emails, expected_status, expected_detail):
+        """Test bulk signup error responses leave participants untouched."""
+        response = client.post(f"/activities/{activity}/bulk_signup", json=emails)
+        assert response.status_code == expected_status
+        assert response.json()["detail"] == expected_detail
+        assert "new@mergington.edu" not in state["Chess Club"]["participants"]
+
+
 class TestRemoveParticipantEndpoint:
     """Test cases for the remove participant endpoint."""
     
-    def test_remove_participant_success(self, client: TestClient, reset_activities):
+    def test_remove_participant_success(self, client: TestClient, reset_activities, state):
         """Test successful removal of a participant."""
         # First verify the participant exists
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in state["Chess Club"]["participants"]
         
         # Remove the participant
         response = client.delete(
@@ -151,31 +175,24 @@ class TestRemoveParticipantEndpoint:
         assert "Chess Club" in data["message"]
         
         # Verify the participant was actually removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in state["Chess Club"]["participants"]
     
-    def test_remove_participant_activity_not_found(self, client: TestClient, reset_activities):
-        """Test removing participant from non-existent activity."""
-        response = client.delete(
-            "/activities/Non-existent Activity/participants/test@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_remove_participant_not_found(self, client: TestClient, reset_activities):
-        """Test removing participant who is not signed up."""
-        response = client.delete(
-            "/activities/Chess Club/participants/nonexistent@mergington.edu"
-        )
+    @pytest.mark.parametrize("activity, email, expected_detail", [
+        # Non-existent activity
+        ("Non-existent Activity", "test@mergington.edu", "Activity not found"),
+        # Participant who is not signed up
+        ("Chess Club", "nonexistent@mergington.edu", "Participant is not signed up for this activity"),
+    ])
+    def test_remove_participant_errors(self, client: TestClient,
+                                       activity, email, expected_detail):
+        """Test remove participant error responses."""
+        response = client.delete(f"/activities/{activity}/participants/{email}")
         assert response.status_code == 404
         
         data = response.json()
-        assert data["detail"] == "Participant is not signed up for this activity"
+        assert data["detail"] == expected_detail
     
-    def test_remove_participant_url_encoding(self, client: TestClient, reset_activities):
+    def test_remove_participant_url_encoding(self, client: TestClient, reset_activities, state):
         """Test removing participant with URL-encoded names."""
         response = client.delete(
             "/activities/Programming%20Class/participants/emma%40mergington.edu"
@@ -183,34 +200,73 @@ class TestRemoveParticipantEndpoint:
         assert response.status_code == 200
         
         # Verify the participant was actually removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "emma@mergington.edu" not in activities_data["Programming Class"]["participants"]
+        assert "emma@mergington.edu" not in state["Programming Class"]["participants"]
+
+
+class TestBulkRemoveParticipantsEndpoint:
+    """Test cases for the bulk remove participants endpoint."""
+    
+    def test_bulk_remove_success(self, client: TestClient, reset_activities, state):
+        """Test removing several participants in one request."""
+        emails = ["michael@mergington.edu", "daniel@mergington.edu"]
+        response = client.delete("/activities/Chess Club/participants", params={"emails": emails})
+        assert response.status_code == 200
+        assert response.json()["message"] == "Removed 2 participants from Chess Club"
+        
+        # Verify the participants were actually removed
+        assert state["Chess Club"]["participants"].keys().isdisjoint(emails)
+    
+    def test_bulk_remove_single_participant_message(self, client: TestClient, reset_activities):
+        """Test the bulk remove message for a single participant."""
+        response = client.delete(
+            "/activities/Chess Club/participants", params={"emails": ["michael@mergington.edu"]}
+        )
+        assert response.status_code == 200
+        assert response.json()["message"] == "Removed 1 participant from Chess Club"
+    
+    @pytest.mark.parametrize("activity, emails, expected_status, expected_detail", [
+        # Non-existent activity
+        ("Non-existent Activity", ["test@mergington.edu"], 404, "Activity not found"),
+        # One participant is not signed up
+        ("Chess Club", ["michael@mergington.edu", "nonexistent@mergington.edu"], 404,
+         "Participant is not signed up for this activity"),
+        # Same participant listed twice
+        ("Chess Club", ["michael@mergington.edu", "michael@mergington.edu"], 400,
+         "Duplicate email in request"),
+    ])
+    def test_bulk_remove_errors(self, client: TestClient, reset_activities, state,
+                                activity, emails, expected_status, expected_detail):
+        """Test bulk remove error responses leave participants untouched."""
+        response = client.delete(f"/activities/{activity}/participants", params={"emails": emails})
+        assert response.status_code == expected_status
+        assert response.json()["detail"] == expected_detail
+        assert "michael@mergington.edu" in state["Chess Club"]["participants"]
+    
+    def test_bulk_remove_missing_emails(self, client: TestClient):
+        """Test bulk remove without emails parameter."""
+        response = client.delete("/activities/Chess Club/participants")
+        assert response.status_code == 422  # Validation error
 
 
 class TestIntegrationScenarios:
     """Integration test scenarios combining multiple operations."""
     
-    def test_signup_and_remove_workflow(self, client: TestClient, reset_activities):
+    def test_signup_and_remove_workflow(self, client: TestClient, reset_activities, state):
         """Test complete workflow of signup and removal."""
         test_email = "integration.test@mergington.edu"
         activity_name = "Chess Club"
         
         # Initial state - participant should not exist
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert test_email not in activities_data[activity_name]["participants"]
+        assert test_email not in state[activity_name]["participants"]
         
         # Sign up participant
         signup_response = client.post(
-            f"/activities/{activity_name}/signup?email={test_email}"
+            f"/activities/{activity_name}/signup", params={"email": test_email}
         )
         assert signup_response.status_code == 200
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert test_email in activities_data[activity_name]["participants"]
+        assert test_email in state[activity_name]["participants"]
         
         # Remove participant
         remove_response = client.delete(
@@ -226,21 +282,21 @@ class TestIntegrationScenarios:
     def test_multiple_signups_different_activities(self, client: TestClient, reset_activities):
         """Test signing up for multiple different activities."""
         test_email = "multi.signup@mergington.edu"
-        activities = ["Chess Club", "Programming Class", "Art Workshop"]
+        activity_names = ["Chess Club", "Programming Class", "Art Workshop"]
         
         # Sign up for multiple activities
-        for activity in activities:
+        for activity in activity_names:
             response = client.post(
-                f"/activities/{activity}/signup?email={test_email}"
+                f"/activities/{activity}/signup", params={"email": test_email}
             )
             assert response.status_code == 200
         
-        # Verify participant is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        for activity in activities:
-            assert test_email in activities_data[activity]["participants"]
+        # Verify participant is in all activities with a single fetch
+        activities_data = client.get("/activities").json()
+        assert all(
+            test_email in activities_data[activity]["participants"]
+            for activity in activity_names
+        )
     
     def test_activity_capacity_tracking(self, client: TestClient, reset_activities):
         """Test that we can track how many spots are left in activities."""
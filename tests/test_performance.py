@@ -2,169 +2,164 @@
 Performance and load tests for the Activities API.
 """
 
+import asyncio
+import httpx
+import itertools
+import json
 import pytest
 import time
 from fastapi.testclient import TestClient
 
+from app import app
+
+from ._asgi import asgi_call
+
+
+# Test emails are built once at import so they stay out of timed regions
+LOAD_EMAILS = tuple(f"load.test.{i}@mergington.edu" for i in range(10))
+FILL_EMAILS = tuple(f"fill.student.{i}@mergington.edu" for i in range(25))
+CONCURRENT_EMAILS = tuple(f"concurrent.{i}@mergington.edu" for i in range(5))
+NEW_CONCURRENT_EMAILS = tuple(f"new.concurrent.{i}@mergington.edu" for i in range(3))
+
 
 class TestPerformance:
     """Basic performance tests."""
     
-    def test_get_activities_response_time(self, client: TestClient, reset_activities):
+    def test_get_activities_response_time(self, benchmark, client: TestClient):
         """Test that getting activities has reasonable response time."""
-        start_time = time.time()
-        response = client.get("/activities")
-        end_time = time.time()
+        response = benchmark.pedantic(client.get, args=("/activities",), iterations=10, rounds=5)
         
         assert response.status_code == 200
-        response_time = end_time - start_time
-        assert response_time < 1.0  # Should respond within 1 second
+        if benchmark.stats:  # None when benchmarking is disabled
+            assert benchmark.stats.stats.median < 1.0  # Should respond within 1 second
     
-    def test_signup_response_time(self, client: TestClient, reset_activities):
+    def test_signup_response_time(self, benchmark, client: TestClient, reset_activities):
         """Test that signup has reasonable response time."""
-        start_time = time.time()
-        response = client.post("/activities/Chess Club/signup?email=perf.test@mergington.edu")
-        end_time = time.time()
-        
-        assert response.status_code == 200
-        response_time = end_time - start_time
-        assert response_time < 1.0  # Should respond within 1 second
-    
-    def test_multiple_rapid_requests(self, client: TestClient, reset_activities):
-        """Test handling of multiple rapid requests."""
-        emails = [f"load.test.{i}@mergington.edu" for i in range(10)]
+        # Every call needs a new email, since repeat signups are rejected
+        emails = (f"perf.test.{i}@mergington.edu" for i in itertools.count())
         
-        start_time = time.time()
-        responses = []
+        def signup():
+            return client.post("/activities/Chess Club/signup", params={"email": next(emails)})
         
-        for email in emails:
-            response = client.post(f"/activities/Programming Class/signup?email={email}")
-            responses.append(response)
+        response = benchmark.pedantic(signup, iterations=10, rounds=5)
         
-        end_time = time.time()
+        assert response.status_code == 200
+        if benchmark.stats:  # None when benchmarking is disabled
+            assert benchmark.stats.stats.median < 1.0  # Should respond within 1 second
+    
+    @pytest.mark.anyio
+    async def test_multiple_rapid_requests(self, async_client: httpx.AsyncClient, reset_activities, state):
+        """Test handling of multiple rapid requests dispatched concurrently."""
+        emails = LOAD_EMAILS
+        
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(*(
+            async_client.post("/activities/Programming Class/signup", params={"email": email})
+            for email in emails
+        ))
+        end_time = time.perf_counter()
         
         # All requests should succeed
-        for response in responses:
-            assert response.status_code == 200
+        assert all(response.status_code == 200 for response in responses)
         
         # Total time should be reasonable
         total_time = end_time - start_time
         assert total_time < 5.0  # Should complete within 5 seconds
         
-        # Verify all participants were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        programming_participants = activities_data["Programming Class"]["participants"]
-        
-        for email in emails:
-            assert email in programming_participants
+        # Verify all participants were added; participants are dict keys, so
+        # the keys view supports set comparison without building a set
+        assert set(emails) <= state["Programming Class"]["participants"].keys()
 
 
 class TestStressScenarios:
     """Test stress scenarios and edge conditions."""
     
-    def test_activity_near_capacity(self, client: TestClient, reset_activities):
-        """Test behavior when activity is near or at capacity."""
-        # Math Olympiad has max 10 participants, currently has 2
-        math_olympiad_emails = [f"math.student.{i}@mergington.edu" for i in range(8)]
-        
-        # Fill up to capacity
-        for email in math_olympiad_emails:
-            response = client.post(f"/activities/Math Olympiad/signup?email={email}")
-            assert response.status_code == 200
-        
-        # Verify we're at capacity
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert len(activities_data["Math Olympiad"]["participants"]) == 10
-        
-        # Note: The current API doesn't enforce capacity limits, but we test the data integrity
-        # In a real application, you might want to add capacity validation
-    
-    def test_large_participant_list_handling(self, client: TestClient, reset_activities):
-        """Test handling activities with large numbers of participants."""
-        # Add many participants to Gym Class (has max 30)
-        gym_emails = [f"gym.student.{i}@mergington.edu" for i in range(25)]
-        
-        for email in gym_emails:
-            response = client.post(f"/activities/Gym Class/signup?email={email}")
-            assert response.status_code == 200
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("activity, count", [
+        ("Math Olympiad", 8),  # max 10, currently has 2: fills to capacity
+        ("Gym Class", 25),  # max 30: large participant list
+        ("Programming Class", 10),  # max 20
+    ])
+    async def test_activity_fill_handling(self, reset_activities, state, activity, count):
+        """Test handling activities filled with many participants."""
+        emails = FILL_EMAILS[:count]
+        initial_count = len(state[activity]["participants"])
+        
+        status, _ = await asgi_call(app, "POST", f"/activities/{activity}/bulk_signup", json=emails)
+        assert status == 200
         
         # Test that we can still retrieve activities efficiently
-        start_time = time.time()
-        response = client.get("/activities")
-        end_time = time.time()
+        start_time = time.perf_counter()
+        status, body = await asgi_call(app, "GET", "/activities")
+        end_time = time.perf_counter()
         
-        assert response.status_code == 200
+        assert status == 200
         response_time = end_time - start_time
         assert response_time < 2.0  # Should still be fast even with many participants
         
         # Verify data integrity
-        activities_data = response.json()
-        gym_participants = activities_data["Gym Class"]["participants"]
-        assert len(gym_participants) >= 27  # Original 2 + 25 new ones
+        participants = json.loads(body)[activity]["participants"]
+        assert len(participants) == initial_count + count
+        
+        # Note: The current API doesn't enforce capacity limits, but we test the data integrity
+        # In a real application, you might want to add capacity validation
+        assert len(participants) <= state[activity]["max_participants"]
 
 
+@pytest.mark.anyio
 class TestConcurrencySimulation:
     """Simulate concurrent operations that might happen in real usage."""
     
-    def test_concurrent_signup_and_removal(self, client: TestClient, reset_activities):
+    async def test_concurrent_signup_and_removal(self, reset_activities, state):
         """Test concurrent signups and removals."""
         # Add several participants
-        test_emails = [f"concurrent.{i}@mergington.edu" for i in range(5)]
+        test_emails = CONCURRENT_EMAILS
         
         for email in test_emails:
-            response = client.post(f"/activities/Drama Club/signup?email={email}")
-            assert response.status_code == 200
+            status, _ = await asgi_call(app, "POST", "/activities/Drama Club/signup", {"email": email})
+            assert status == 200
         
         # Now remove some while adding others
         removal_emails = test_emails[:2]  # Remove first 2
-        addition_emails = [f"new.concurrent.{i}@mergington.edu" for i in range(3)]  # Add 3 new
+        addition_emails = NEW_CONCURRENT_EMAILS  # Add 3 new
         
         # Remove participants
-        for email in removal_emails:
-            response = client.delete(f"/activities/Drama Club/participants/{email}")
-            assert response.status_code == 200
+        status, _ = await asgi_call(
+            app, "DELETE", "/activities/Drama Club/participants", {"emails": removal_emails}
+        )
+        assert status == 200
         
         # Add new participants
         for email in addition_emails:
-            response = client.post(f"/activities/Drama Club/signup?email={email}")
-            assert response.status_code == 200
+            status, _ = await asgi_call(app, "POST", "/activities/Drama Club/signup", {"email": email})
+            assert status == 200
         
         # Verify final state
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        drama_participants = activities_data["Drama Club"]["participants"]
+        drama_participants = state["Drama Club"]["participants"].keys()
         
         # Should not contain removed emails
-        for email in removal_emails:
-            assert email not in drama_participants
+        assert drama_participants.isdisjoint(removal_emails)
         
         # Should contain new emails
-        for email in addition_emails:
-            assert email in drama_participants
+        assert set(addition_emails) <= drama_participants
     
-    def test_rapid_state_changes(self, client: TestClient, reset_activities):
+    async def test_rapid_state_changes(self, reset_activities):
         """Test rapid state changes on the same activity."""
         test_email = "rapid.change@mergington.edu"
         activity = "Science Club"
+        signup_url = f"/activities/{activity}/signup"
+        remove_url = f"/activities/{activity}/participants/{test_email}"
         
-        # Rapidly add and remove participant multiple times
+        # Rapidly add and remove participant multiple times. Each add only
+        # succeeds if the previous remove took effect and vice versa, so the
+        # status codes alone verify every intermediate state.
         for i in range(5):
-            # Add
-            add_response = client.post(f"/activities/{activity}/signup?email={test_email}")
-            assert add_response.status_code == 200
-            
-            # Verify added
-            activities_response = client.get("/activities")
-            activities_data = activities_response.json()
-            assert test_email in activities_data[activity]["participants"]
+            add_status, _ = await asgi_call(app, "POST", signup_url, {"email": test_email})
+            assert add_status == 200
             
-            # Remove
-            remove_response = client.delete(f"/activities/{activity}/participants/{test_email}")
-            assert remove_response.status_code == 200
-            
-            # Verify removed
-            activities_response = client.get("/activities")
-            activities_data = activities_response.json()
-            assert test_email not in activities_data[activity]["participants"]
\ No newline at end of file
+            remove_status, _ = await asgi_call(app, "DELETE", remove_url)
+            assert remove_status == 200
+        
+        # Verify final state
+        _, body = await asgi_call(app, "GET", "/activities")
+        assert test_email not in json.loads(body)[activity]["participants"]